@@ -0,0 +1,251 @@
+import asyncio
+import csv
+import io
+import os
+import uuid
+from collections import deque
+from typing import IO, Any, AsyncIterator, Dict, Iterable, Iterator, List, Union
+import httpx
+import pyarrow as pa
+import pyarrow.parquet as pq
+import requests
+from requests.adapters import HTTPAdapter
+
+# Constants for API connection
+API_URL = os.getenv("API_URL", "http://127.0.0.1:8000")
+TIMEOUT_SECONDS = 30
+DEFAULT_POOL_SIZE = 10
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_MAX_IN_FLIGHT = 4
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB per upload chunk
+ARROW_FORMATS = ['.arrow', '.arrows', '.feather']
+DEFAULT_UPLOAD_NAME = "upload.csv"  # Sent for file objects without a name; the server picks the parser by extension
+
+# A file to upload: a path on disk, or a binary file object such as a Streamlit upload.
+# Pass filename for objects without a name, such as io.BytesIO, so the server can tell the format.
+UploadSource = Union[str, IO[bytes]]
+
+# Read only the column names of a CSV, Parquet or Arrow IPC file
+def read_columns(file_path: str) -> List[str]:
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext == '.parquet':
+        # Parquet keeps its schema in the footer, so no row data is read
+        return pq.read_schema(file_path).names
+    if ext in ARROW_FORMATS:
+        # Only the schema message is read; record batches stay unread in the memory map
+        with pa.memory_map(file_path, "r") as source:
+            try:
+                return pa.ipc.open_file(source).schema.names
+            except pa.ArrowInvalid:
+                source.seek(0)
+                return pa.ipc.open_stream(source).schema.names
+    with open(file_path, "r", newline="") as f:
+        return next(csv.reader(f), [])
+
+# Serialize a batch of records to CSV bytes so the server parses them like any uploaded file
+def records_to_csv(records: List[Dict[str, Any]]) -> bytes:
+    columns = list(dict.fromkeys(key for record in records for key in record))
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns)
+    writer.writeheader()
+    writer.writerows(records)
+    return buffer.getvalue().encode("utf-8")
+
+# Group an iterable of records into lists of at most batch_size
+def iter_batches(records: Iterable[Dict[str, Any]], batch_size: int) -> Iterator[List[Dict[str, Any]]]:
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+# Raise a ValueError with the server's message if a batch prediction failed
+def parse_batch_response(status_code: int, body: Dict[str, Any]) -> List[Any]:
+    if status_code != 200 or "predictions" not in body:
+        raise ValueError(body.get("error", f"Batch prediction failed with status {status_code}"))
+    return body["predictions"]
+
+
+class MultipartUpload:
+    """Multipart/form-data body that streams a file from disk or a file object in fixed-size chunks"""
+    def __init__(self, source: UploadSource, fields: Dict[str, str] = None, filename: str = None, chunk_size: int = UPLOAD_CHUNK_SIZE):
+        self.source = source
+        self.chunk_size = chunk_size
+        self.boundary = uuid.uuid4().hex
+        if isinstance(source, str):
+            name = source
+            # Stat eagerly so a missing file raises FileNotFoundError at the call site
+            self._file_size = os.path.getsize(source)
+        else:
+            name = getattr(source, "name", None) or DEFAULT_UPLOAD_NAME
+            self._start = source.tell()
+            self._file_size = source.seek(0, os.SEEK_END) - self._start
+            source.seek(self._start)
+        name = filename or name
+        filename = os.path.basename(name).replace('"', '%22')
+        content_type = "text/csv" if name.lower().endswith(".csv") else "application/octet-stream"
+        head = io.BytesIO()
+        for field, value in (fields or {}).items():
+            if value is None:
+                continue
+            head.write(f'--{self.boundary}\r\nContent-Disposition: form-data; name="{field}"\r\n\r\n{value}\r\n'.encode("utf-8"))
+        head.write(f'--{self.boundary}\r\nContent-Disposition: form-data; name="file"; filename="{filename}"\r\nContent-Type: {content_type}\r\n\r\n'.encode("utf-8"))
+        self._head = head.getvalue()
+        self._tail = f'\r\n--{self.boundary}--\r\n'.encode("utf-8")
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {
+            "Content-Type": f"multipart/form-data; boundary={self.boundary}",
+            "Content-Length": str(len(self))
+        }
+
+    def __len__(self) -> int:
+        return len(self._head) + self._file_size + len(self._tail)
+
+    def _iter_file(self, f: IO[bytes]) -> Iterator[bytes]:
+        while True:
+            chunk = f.read(self.chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self._head
+        if isinstance(self.source, str):
+            with open(self.source, "rb") as f:
+                yield from self._iter_file(f)
+        else:
+            self.source.seek(self._start)
+            yield from self._iter_file(self.source)
+        yield self._tail
+
+    async def aiter_chunks(self) -> AsyncIterator[bytes]:
+        """Async version of iteration, required for streaming bodies with httpx.AsyncClient"""
+        for chunk in self:
+            yield chunk
+
+
+class ApiClient:
+    """Connection-pooled, keep-alive client for the classifier API"""
+    def __init__(self, base_url: str = API_URL, timeout: float = TIMEOUT_SECONDS, pool_size: int = DEFAULT_POOL_SIZE, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.batch_size = batch_size
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.session.close()
+
+    def _upload(self, path: str, file: UploadSource, fields: Dict[str, str] = None, filename: str = None) -> requests.Response:
+        body = MultipartUpload(file, fields, filename)
+        return self.session.post(f"{self.base_url}{path}", data=body, headers=body.headers, timeout=self.timeout)
+
+    def info(self) -> requests.Response:
+        """Get model information"""
+        return self.session.get(f"{self.base_url}/info", timeout=self.timeout)
+
+    def train(self, file: UploadSource, target_column: str, filename: str = None) -> requests.Response:
+        """Stream a training file to /train"""
+        return self._upload("/train", file, {"target_column": target_column}, filename)
+
+    def test(self, file: UploadSource, target_column: str = None, filename: str = None) -> requests.Response:
+        """Stream a test file to /test"""
+        return self._upload("/test", file, {"target_column": target_column}, filename)
+
+    def predict(self, record: Dict[str, Any]) -> requests.Response:
+        """Classify a single record"""
+        return self.session.post(f"{self.base_url}/predict", json=record, timeout=self.timeout)
+
+    def predict_file(self, file: UploadSource, filename: str = None) -> requests.Response:
+        """Stream a file of records to /predict/batch"""
+        return self._upload("/predict/batch", file, filename=filename)
+
+    def predict_batch(self, records: List[Dict[str, Any]]) -> List[Any]:
+        """Classify a list of records with a single /predict/batch call"""
+        files = {"file": ("batch.csv", records_to_csv(records), "text/csv")}
+        response = self.session.post(f"{self.base_url}/predict/batch", files=files, timeout=self.timeout)
+        return parse_batch_response(response.status_code, response.json())
+
+    def predict_many(self, records: Iterable[Dict[str, Any]], batch_size: int = None) -> Iterator[Any]:
+        """Classify any number of records, grouping them into /predict/batch calls"""
+        for batch in iter_batches(records, batch_size or self.batch_size):
+            yield from self.predict_batch(batch)
+
+
+class AsyncApiClient:
+    """Asyncio, connection-pooled client for the classifier API with pipelined batch predictions"""
+    def __init__(self, base_url: str = API_URL, timeout: float = TIMEOUT_SECONDS, pool_size: int = DEFAULT_POOL_SIZE, batch_size: int = DEFAULT_BATCH_SIZE, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT):
+        self.batch_size = batch_size
+        self.max_in_flight = max_in_flight
+        limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+        self.client = httpx.AsyncClient(base_url=base_url.rstrip("/"), timeout=timeout, limits=limits)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        await self.client.aclose()
+
+    async def _upload(self, path: str, file: UploadSource, fields: Dict[str, str] = None, filename: str = None) -> httpx.Response:
+        body = MultipartUpload(file, fields, filename)
+        return await self.client.post(path, content=body.aiter_chunks(), headers=body.headers)
+
+    async def info(self) -> httpx.Response:
+        """Get model information"""
+        return await self.client.get("/info")
+
+    async def train(self, file: UploadSource, target_column: str, filename: str = None) -> httpx.Response:
+        """Stream a training file to /train"""
+        return await self._upload("/train", file, {"target_column": target_column}, filename)
+
+    async def test(self, file: UploadSource, target_column: str = None, filename: str = None) -> httpx.Response:
+        """Stream a test file to /test"""
+        return await self._upload("/test", file, {"target_column": target_column}, filename)
+
+    async def predict(self, record: Dict[str, Any]) -> httpx.Response:
+        """Classify a single record"""
+        return await self.client.post("/predict", json=record)
+
+    async def predict_file(self, file: UploadSource, filename: str = None) -> httpx.Response:
+        """Stream a file of records to /predict/batch"""
+        return await self._upload("/predict/batch", file, filename=filename)
+
+    async def predict_batch(self, records: List[Dict[str, Any]]) -> List[Any]:
+        """Classify a list of records with a single /predict/batch call"""
+        files = {"file": ("batch.csv", records_to_csv(records), "text/csv")}
+        response = await self.client.post("/predict/batch", files=files)
+        return parse_batch_response(response.status_code, response.json())
+
+    async def predict_many(self, records: Iterable[Dict[str, Any]], batch_size: int = None, max_in_flight: int = None) -> AsyncIterator[Any]:
+        """Classify any number of records, keeping several batches in flight and yielding results in order"""
+        max_in_flight = max_in_flight or self.max_in_flight
+        pending = deque()
+        try:
+            for batch in iter_batches(records, batch_size or self.batch_size):
+                pending.append(asyncio.ensure_future(self.predict_batch(batch)))
+                if len(pending) >= max_in_flight:
+                    for prediction in await pending.popleft():
+                        yield prediction
+            while pending:
+                for prediction in await pending.popleft():
+                    yield prediction
+        finally:
+            # Cancel outstanding batches if the caller stopped early or a batch failed
+            for task in pending:
+                task.cancel()
@@ -0,0 +1,54 @@
+import argparse
+import asyncio
+import csv
+import json
+import sys
+import time
+import httpx
+from typing import Any, Dict, Iterator
+from UI.api_client import API_URL, DEFAULT_BATCH_SIZE, DEFAULT_MAX_IN_FLIGHT, AsyncApiClient
+
+# Stream records from an NDJSON or CSV file one at a time
+def iter_records(file_path: str) -> Iterator[Dict[str, Any]]:
+    with open(file_path, "r", newline="") as f:
+        if file_path.lower().endswith((".ndjson", ".jsonl")):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from csv.DictReader(f)
+
+async def score_file(input_path: str, output, base_url: str = API_URL, batch_size: int = DEFAULT_BATCH_SIZE, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT) -> int:
+    """Push every record of a file through /predict/batch and write one NDJSON prediction per line"""
+    count = 0
+    async with AsyncApiClient(base_url, pool_size=max_in_flight, batch_size=batch_size, max_in_flight=max_in_flight) as client:
+        async for prediction in client.predict_many(iter_records(input_path)):
+            output.write(json.dumps({"prediction": prediction}) + "\n")
+            count += 1
+    return count
+
+def main():
+    parser = argparse.ArgumentParser(description="Score a large NDJSON or CSV file against the classifier API")
+    parser.add_argument("input", help="Input .ndjson/.jsonl or .csv file")
+    parser.add_argument("-o", "--output", help="Output NDJSON file (default: stdout)")
+    parser.add_argument("--url", default=API_URL, help="API base URL")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Records per /predict/batch call")
+    parser.add_argument("--in-flight", type=int, default=DEFAULT_MAX_IN_FLIGHT, help="Batches sent concurrently")
+    args = parser.parse_args()
+
+    output = open(args.output, "w") if args.output else sys.stdout
+    start = time.perf_counter()
+    try:
+        count = asyncio.run(score_file(args.input, output, args.url, args.batch_size, args.in_flight))
+    except (FileNotFoundError, ValueError, httpx.HTTPError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    elapsed = time.perf_counter() - start
+    print(f"Scored {count} records in {elapsed:.2f}s ({count / elapsed:,.0f} records/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
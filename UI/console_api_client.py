@@ -1,10 +1,10 @@
-import requests
-import os
+from UI.api_client import ApiClient, read_columns
 
 # Constants for API connection
-API_URL = os.getenv("API_URL", "http://127.0.0.1:8000")
 DECODE_ERROR_MSG = "Error: Could not decode server response. Raw response:"
-TIMEOUT_SECONDS = 30
+
+# Shared keep-alive client so every call reuses pooled connections
+client = ApiClient()
 
 # Train the model via API (non-interactive if params provided)
 def train_model(file_path=None, target_column=None):
@@ -13,14 +13,8 @@ def train_model(file_path=None, target_column=None):
     if target_column is None:
         target_column = input("Enter target column name: ")
     try:
-        with open(file_path, "rb") as f:
-            # Send POST request to /train endpoint
-            response = requests.post(
-                f"{API_URL}/train",
-                files={"file": f},
-                data={"target_column": target_column},
-                timeout=TIMEOUT_SECONDS
-            )
+        # Stream the file to the /train endpoint
+        response = client.train(file_path, target_column)
         try:
             result = response.json()
             if "status" in result:
@@ -49,25 +43,18 @@ def test_model(file_path=None, target_column=None):
     if file_path is None:
         file_path = input("Enter a file path: ")
     try:
-        with open(file_path, "rb") as f:
-            # Read CSV to get columns if needed
-            import pandas as pd
-            df = pd.read_csv(file_path)
-            if target_column is None:
-                print("Available columns in test data:")
-                for i, header in enumerate(df.columns):
-                    print(f"{i+1}. {header}")
-                target_column = input("Enter target column name for test data: ")
-            if target_column not in df.columns:
-                print("Target column not found in test data.")
-                return
-            # Reset file pointer and send POST request to /test
-            f.seek(0)
-            files = {"file": f}
-            data = {}
-            if target_column.strip():
-                data["target_column"] = target_column
-            response = requests.post(f"{API_URL}/test", files=files, data=data, timeout=TIMEOUT_SECONDS)
+        # Read only the header row to get columns
+        columns = read_columns(file_path)
+        if target_column is None:
+            print("Available columns in test data:")
+            for i, header in enumerate(columns):
+                print(f"{i+1}. {header}")
+            target_column = input("Enter target column name for test data: ")
+        if target_column not in columns:
+            print("Target column not found in test data.")
+            return
+        # Stream the file to the /test endpoint
+        response = client.test(file_path, target_column if target_column.strip() else None)
         try:
             result = response.json()
             if "accuracy" in result:
@@ -84,7 +71,7 @@ def test_model(file_path=None, target_column=None):
 # Classify a single user-input record
 def predict_single_record():
     # First get model info to know what features are needed
-    response = requests.get(f"{API_URL}/info", timeout=TIMEOUT_SECONDS)
+    response = client.info()
     try:
         model_info = response.json()
         if "Features" not in model_info:
@@ -101,7 +88,7 @@ def predict_single_record():
             record[feature] = value
             
         # Send prediction request
-        response = requests.post(f"{API_URL}/predict", json=record, timeout=TIMEOUT_SECONDS)
+        response = client.predict(record)
         try:
             result = response.json()
             if "prediction" in result:
@@ -115,7 +102,7 @@ def predict_single_record():
 
 # Display detailed model information
 def show_model_info():
-    response = requests.get(f"{API_URL}/info", timeout=TIMEOUT_SECONDS)
+    response = client.info()
     try:
         info = response.json()
         print("\nModel Information")
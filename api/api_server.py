@@ -1,27 +1,73 @@
 # FastAPI server for Naive Bayes classifier API
-from fastapi import FastAPI, UploadFile, File, Form
+from fastapi import FastAPI, UploadFile, File, Form, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from classifier.engine import ClassificationEngine
-from model_management.data_loader import DataLoader
+from model_management.data_loader import DataLoader, read_arrow_ipc
+import asyncio
+import fcntl
 import hashlib
 import json
 import os
+import tempfile
+from contextlib import contextmanager
 from model_management.validator import Validator
+from model_management.model_store import ModelStore
 
 # Constants
 MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB file size limit
-SUPPORTED_FORMATS = ['.csv']
+MAX_COLUMNAR_FILE_SIZE = 1024 * 1024 * 1024  # 1GB limit for Parquet/Arrow, which skip text parsing
+SUPPORTED_FORMATS = ['.csv', '.parquet', '.arrow', '.arrows', '.feather']
 CACHE_FILE = 'results_cache.json'  # Cache file for results
+CACHE_LOCK_FILE = CACHE_FILE + '.lock'  # Serializes cache updates across workers
 
 app = FastAPI() # Create FastAPI app
 engine = ClassificationEngine() # In-memory model engine
+store = ModelStore() # Shared model artifacts, so every worker serves the same version
+loaded_version = 0 # Store version currently held by this worker's engine
+model_lock = asyncio.Lock() # Held while this worker loads or changes its model
 
-# Compute a unique hash for a file and target column
-def get_file_hash(file_bytes, target_column):
+# Load the latest published model if another worker has published a newer one
+def sync_model():
+    global loaded_version
+    version = store.current_version()
+    if version == loaded_version:
+        return
+    try:
+        version, state = store.load()
+        if state is not None:
+            engine.set_state(state)
+    except Exception as e:
+        # A missing, corrupt or incompatible artifact must not take the server down; /train can replace it
+        print(f"Error loading model version {version}, keeping the current model: {e}")
+    # Recorded even on failure so the same version is not retried on every request
+    loaded_version = version
+
+# Publish this worker's model so the other workers pick it up
+def publish_model():
+    global loaded_version
+    loaded_version = store.publish(engine.get_state())
+
+# Check the shared version counter before every request, loading new versions off the event loop
+@app.middleware("http")
+async def sync_shared_model(request: Request, call_next):
+    # While another request is loading, keep serving the current model rather than waiting
+    if store.current_version() != loaded_version and not model_lock.locked():
+        async with model_lock:
+            await run_in_threadpool(sync_model)
+    return await call_next(request)
+
+# Compute a unique hash for a file and target column, and optionally the features of the model that scored it
+def get_file_hash(file_bytes, target_column, features=None):
     hasher = hashlib.sha256()
     hasher.update(file_bytes)
     hasher.update(target_column.encode('utf-8'))
+    if features is not None:
+        # Pruning changes the served model without retraining, so its features are part of the key
+        hasher.update(json.dumps([str(feature) for feature in features]).encode('utf-8'))
     return hasher.hexdigest()
 
 # Load results cache from disk
@@ -31,43 +77,100 @@ def load_cache():
             return json.load(f)
     return {}
 
-# Save results cache to disk
+# Save results cache to disk; replacing the file atomically means readers never see a partial write
 def save_cache(cache):
-    with open(CACHE_FILE, 'w') as f:
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(CACHE_FILE)), suffix='.tmp')
+    with os.fdopen(fd, 'w') as f:
         json.dump(cache, f)
+    os.replace(tmp_path, CACHE_FILE)
+
+# Hold an exclusive cross-process lock on the results cache
+@contextmanager
+def cache_locked():
+    with open(CACHE_LOCK_FILE, 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+# Update one cache entry under the lock, re-reading the cache so other workers' entries are kept
+def update_cache(file_hash, values, replace=False):
+    with cache_locked():
+        cache = load_cache()
+        cache[file_hash] = dict(values) if replace else {**cache.get(file_hash, {}), **values}
+        save_cache(cache)
+
+# Get the lowercase extension of an uploaded file, validating it is supported
+def get_upload_format(filename: str) -> str:
+    ext = os.path.splitext(filename or "")[1].lower()
+    if ext not in SUPPORTED_FORMATS:
+        raise ValueError(f"Unsupported file format '{ext}', expected one of: {', '.join(SUPPORTED_FORMATS)}")
+    return ext
 
-# Read and validate uploaded CSV file
-def read_csv_upload(upload_file: UploadFile) -> pd.DataFrame:
-    if not upload_file.filename.lower().endswith('.csv'):
-        raise ValueError("File must be a CSV file")
-    if hasattr(upload_file, 'size') and upload_file.size and upload_file.size > MAX_FILE_SIZE:
-        raise ValueError("File size exceeds 100MB limit")
+# Validate format and size of an upload before reading it into memory, then return its bytes
+async def read_upload(upload_file: UploadFile) -> bytes:
+    ext = get_upload_format(upload_file.filename)
+    limit = MAX_FILE_SIZE if ext == '.csv' else MAX_COLUMNAR_FILE_SIZE
+    limit_error = f"File size exceeds {limit // (1024 * 1024)}MB limit"
+    if upload_file.size is not None and upload_file.size > limit:
+        raise ValueError(limit_error)
+    file_bytes = await upload_file.read()
+    # Size is unknown for some clients until the body has been read
+    if len(file_bytes) > limit:
+        raise ValueError(limit_error)
+    return file_bytes
+
+# Read uploaded CSV, Parquet or Arrow IPC bytes, optionally keeping only the given columns
+def read_table_upload(filename: str, file_bytes: bytes, columns=None) -> pd.DataFrame:
+    ext = get_upload_format(filename)
+    wanted = set(columns) if columns is not None else None
     try:
-        df = pd.read_csv(upload_file.file)
-        if df.empty:
-            raise ValueError("CSV file is empty")
-        return df
+        if ext == '.csv':
+            usecols = (lambda column: column in wanted) if wanted is not None else None
+            df = pd.read_csv(pd.io.common.BytesIO(file_bytes), usecols=usecols)
+        else:
+            # Wrap the upload without copying; Arrow buffers then reference it directly
+            source = pa.BufferReader(pa.py_buffer(file_bytes))
+            if ext == '.parquet':
+                parquet_file = pq.ParquetFile(source)
+                names = parquet_file.schema_arrow.names
+                selected = [name for name in names if name in wanted] if wanted is not None else None
+                table = parquet_file.read(columns=selected)
+            else:
+                table = read_arrow_ipc(source)
+                if wanted is not None:
+                    table = table.select([name for name in table.column_names if name in wanted])
+            df = table.to_pandas()
     except pd.errors.EmptyDataError:
-        raise ValueError("CSV file is empty")
+        raise ValueError("File is empty")
     except pd.errors.ParserError as e:
         raise ValueError(f"Error parsing CSV file: {e}")
+    except pa.ArrowException as e:
+        raise ValueError(f"Error reading {ext[1:]} file: {e}")
+    if wanted is not None and len(df.columns) == 0:
+        raise ValueError(f"File contains none of the model features; missing: {', '.join(map(str, columns))}")
+    if df.empty:
+        raise ValueError("File is empty")
+    return df
 
 # Train endpoint: builds model and caches results
 @app.post("/train")
 async def train(file: UploadFile = File(...), target_column: str = Form(...)):
     try:
-        file_bytes = await file.read()
-        df = pd.read_csv(pd.io.common.BytesIO(file_bytes))
+        file_bytes = await read_upload(file)
+        df = read_table_upload(file.filename, file_bytes)
         file_hash = get_file_hash(file_bytes, target_column)
         cache = load_cache()
-        # Always (re)train the in-memory model, even if cached
-        engine.build_model(df, target_column)
+        # Always (re)train the in-memory model, even if cached; waiting for any load in progress so it cannot overwrite the new model
+        async with model_lock:
+            if engine.build_model(df, target_column):
+                publish_model()
         if file_hash in cache:
             # Return cached status if model already built
             return {"status": "Model trained (cached)", "target_column": target_column, "cached": True}
         # If not cached, cache it
-        cache[file_hash] = {"status": "trained", "target_column": target_column}
-        save_cache(cache)
+        update_cache(file_hash, {"status": "trained", "target_column": target_column}, replace=True)
         return {"status": "Model trained", "target_column": target_column, "cached": False}
     except ValueError as e:
         return JSONResponse(status_code=400, content={"error": str(e)})
@@ -83,7 +186,8 @@ async def predict(record: dict):
         if not record or not isinstance(record, dict):
             return JSONResponse(status_code=400, content={"error": "Record must be a non-empty dictionary"})
         result = engine.classify_single_record(record=record)
-        return {"prediction": result}
+        # Class labels read from numeric columns are numpy scalars, which are not JSON serializable
+        return {"prediction": result.item() if hasattr(result, 'item') else result}
     except ValueError as e:
         return JSONResponse(status_code=400, content={"error": str(e)})
     except Exception as e:
@@ -93,14 +197,18 @@ async def predict(record: dict):
 @app.post("/test")
 async def test(file: UploadFile = File(...), target_column: str = Form(None)):
     try:
-        file_bytes = await file.read()
-        df = pd.read_csv(pd.io.common.BytesIO(file_bytes))
         if not engine.is_model_ready():
             return JSONResponse(status_code=400, content={"error": "Model is not trained yet"})
+        file_bytes = await read_upload(file)
+        # Only the model's features and the target are needed for scoring
+        columns = engine.get_features()
+        if target_column and target_column.strip():
+            columns.append(target_column)
+        df = read_table_upload(file.filename, file_bytes, columns=columns)
         if target_column and target_column.strip():
             if target_column not in df.columns:
                 return JSONResponse(status_code=400, content={"error": f"Target column '{target_column}' not found in test data"})
-        file_hash = get_file_hash(file_bytes, target_column or "")
+        file_hash = get_file_hash(file_bytes, target_column or "", engine.get_features())
         cache = load_cache()
         # Return cached results if available
         if file_hash in cache and "accuracy" in cache[file_hash] and "confusion_matrix" in cache[file_hash]:
@@ -112,16 +220,48 @@ async def test(file: UploadFile = File(...), target_column: str = Form(None)):
         validator = Validator()
         cm = validator.compute_confusion_matrix(y_test, predictions).tolist()
         accuracy = sum(1 for prediction, actual in zip(predictions, y_test) if prediction == actual) / len(y_test)
-        cache[file_hash] = cache.get(file_hash, {}) 
-        cache[file_hash]["accuracy"] = accuracy
-        cache[file_hash]["confusion_matrix"] = cm
-        save_cache(cache)
+        update_cache(file_hash, {"accuracy": accuracy, "confusion_matrix": cm})
         return {"accuracy": accuracy, "confusion_matrix": cm, "cached": False}
     except ValueError as e:
         return JSONResponse(status_code=400, content={"error": str(e)})
     except Exception as e:
         return JSONResponse(status_code=500, content={"error": f"Internal server error: {str(e)}"})
 
+# Batch predict endpoint: classify every record in an uploaded CSV, Parquet or Arrow file
+@app.post("/predict/batch")
+async def predict_batch(file: UploadFile = File(...)):
+    try:
+        if not engine.is_model_ready():
+            return JSONResponse(status_code=400, content={"error": "Model is not trained yet"})
+        file_bytes = await read_upload(file)
+        df = read_table_upload(file.filename, file_bytes, columns=engine.get_features())
+        predictions = engine._classifier.classify_group(df)
+        # Convert numpy scalars to native Python types for the JSON response
+        return {"predictions": pd.Series(predictions).tolist(), "count": len(predictions)}
+    except ValueError as e:
+        return JSONResponse(status_code=400, content={"error": str(e)})
+    except Exception as e:
+        return JSONResponse(status_code=500, content={"error": f"Internal server error: {str(e)}"})
+
+# Feature selection endpoint: report accuracy/latency per top-k and optionally prune the model to k features
+@app.post("/select_features")
+async def select_features(file: UploadFile = File(...), target_column: str = Form(None), method: str = Form('mutual_info'), ks: str = Form(None), k: int = Form(None)):
+    try:
+        if not engine.is_model_ready():
+            return JSONResponse(status_code=400, content={"error": "Model is not trained yet"})
+        file_bytes = await read_upload(file)
+        df = read_table_upload(file.filename, file_bytes)
+        k_values = [int(value) for value in ks.split(',') if value.strip()] if ks else None
+        async with model_lock:
+            report = engine.feature_selection_report(df, target_column, ks=k_values, method=method)
+            features = engine.select_features(k, method=method) if k is not None else None
+            publish_model()
+        return {"method": method, "report": report, "selected_features": features}
+    except ValueError as e:
+        return JSONResponse(status_code=400, content={"error": str(e)})
+    except Exception as e:
+        return JSONResponse(status_code=500, content={"error": f"Internal server error: {str(e)}"})
+
 # Info endpoint: return model metadata
 @app.get("/info")
 async def info():
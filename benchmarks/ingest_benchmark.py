@@ -0,0 +1,47 @@
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+import pyarrow.feather as feather
+import tempfile
+import time
+import sys, os
+from model_management.data_loader import DataLoader
+
+DEFAULT_CSV = 'data/phishing.csv'
+REPEATS = 20
+
+def time_load(load, path, repeats=REPEATS):
+    """Return the best wall time of loading a file with a DataLoader method"""
+    best = float('inf')
+    for _ in range(repeats):
+        loader = DataLoader()
+        start = time.perf_counter()
+        if not getattr(loader, load)(path):
+            raise RuntimeError(f"Failed to load {path}")
+        best = min(best, time.perf_counter() - start)
+    return best, len(loader.get_data())
+
+def run(csv_file=DEFAULT_CSV, repeats=REPEATS):
+    """Compare ingest throughput of CSV, Parquet and Arrow IPC copies of the same data"""
+    table = pacsv.read_csv(csv_file)
+    with tempfile.TemporaryDirectory() as tmp:
+        # Write the same table in each columnar format
+        parquet_file = os.path.join(tmp, 'data.parquet')
+        arrow_file = os.path.join(tmp, 'data.arrow')
+        pq.write_table(table, parquet_file)
+        feather.write_feather(table, arrow_file, compression='uncompressed')
+
+        cases = [
+            ('csv', 'load_csv', csv_file),
+            ('parquet', 'load_parquet', parquet_file),
+            ('arrow', 'load_arrow', arrow_file),
+        ]
+        print(f"{'format':<10}{'size (KB)':>12}{'best (ms)':>12}{'rows/s':>14}{'MB/s':>10}")
+        for name, load, path in cases:
+            seconds, rows = time_load(load, path, repeats)
+            size = os.path.getsize(path)
+            print(f"{name:<10}{size / 1024:>12.1f}{seconds * 1000:>12.2f}{rows / seconds:>14,.0f}{size / seconds / 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    input_csv = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_CSV
+    run(input_csv)
@@ -0,0 +1,97 @@
+import argparse
+import csv
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from multiprocessing import Pool
+from UI.api_client import ApiClient
+
+DEFAULT_TRAIN_CSV = 'data/phishing_train.csv'
+DEFAULT_TARGET = 'class'
+DEFAULT_WORKERS = [1, 2, 4]
+DEFAULT_DURATION = 10.0
+STARTUP_TIMEOUT = 30.0
+
+def wait_until_ready(base_url, timeout=STARTUP_TIMEOUT):
+    """Poll /info until the server accepts connections"""
+    deadline = time.monotonic() + timeout
+    with ApiClient(base_url, timeout=1) as client:
+        while time.monotonic() < deadline:
+            try:
+                if client.info().ok:
+                    return
+            except Exception:
+                time.sleep(0.2)
+    raise RuntimeError(f"Server at {base_url} did not start within {timeout}s")
+
+def load_records(csv_file, target_column, count=100):
+    """Read a few feature records from the training file to replay as /predict requests"""
+    with open(csv_file, newline='') as f:
+        records = []
+        for row in csv.DictReader(f):
+            row.pop(target_column, None)
+            # The server was trained on pandas-parsed numbers, so send numbers back
+            records.append({key: int(value) if value.lstrip('-').isdigit() else value for key, value in row.items()})
+            if len(records) >= count:
+                return records
+    return records
+
+def run_client(args):
+    """Send /predict requests over one keep-alive connection until the deadline; return the count"""
+    base_url, records, deadline = args
+    sent = 0
+    with ApiClient(base_url, pool_size=1) as client:
+        while time.time() < deadline:
+            response = client.predict(records[sent % len(records)])
+            if not response.ok:
+                raise RuntimeError(f"Prediction failed: {response.text}")
+            sent += 1
+    return sent
+
+def measure(workers, port, train_csv, target_column, clients, duration):
+    """Start uvicorn with the given worker count, train once, and return /predict requests per second"""
+    base_url = f"http://127.0.0.1:{port}"
+    with tempfile.TemporaryDirectory() as store_dir:
+        env = dict(os.environ, MODEL_STORE_DIR=store_dir)
+        server = subprocess.Popen(
+            [sys.executable, '-m', 'uvicorn', 'api.api_server:app', '--port', str(port), '--workers', str(workers), '--log-level', 'warning'],
+            env=env
+        )
+        try:
+            wait_until_ready(base_url)
+            # Train on one worker; the others load the published version on their next request
+            with ApiClient(base_url, timeout=120) as client:
+                if not client.train(train_csv, target_column).ok:
+                    raise RuntimeError("Training failed")
+            records = load_records(train_csv, target_column)
+            deadline = time.time() + duration
+            with Pool(clients) as pool:
+                total = sum(pool.map(run_client, [(base_url, records, deadline)] * clients))
+            return total / duration
+        finally:
+            server.terminate()
+            server.wait()
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure /predict throughput scaling with uvicorn worker count")
+    parser.add_argument("--train", default=DEFAULT_TRAIN_CSV, help="Training CSV")
+    parser.add_argument("--target", default=DEFAULT_TARGET, help="Target column")
+    parser.add_argument("--workers", default=','.join(map(str, DEFAULT_WORKERS)), help="Comma-separated worker counts")
+    parser.add_argument("--clients-per-worker", type=int, default=4, help="Concurrent client processes per server worker")
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION, help="Seconds to measure each worker count")
+    parser.add_argument("--port", type=int, default=8100, help="Port for the server under test")
+    args = parser.parse_args()
+
+    print(f"{'workers':>8}{'req/s':>12}{'speedup':>10}{'efficiency':>12}")
+    baseline = None
+    for workers in [int(value) for value in args.workers.split(',')]:
+        throughput = measure(workers, args.port, args.train, args.target, workers * args.clients_per_worker, args.duration)
+        baseline = baseline or throughput / workers
+        speedup = throughput / baseline
+        print(f"{workers:>8}{throughput:>12,.0f}{speedup:>10.2f}{speedup / workers:>12.0%}")
+
+
+if __name__ == "__main__":
+    main()
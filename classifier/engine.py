@@ -1,10 +1,12 @@
 import pandas as pd
+import time
 from model_management.builder import NaiveBayesTrainer
 from classifier.classifier import NaiveBayesClassifier
 from model_management.model import NaiveBayesModel
 from model_management.cleaner import Cleaner
 from model_management.validator import Validator
-from typing import Dict, Any
+from model_management.feature_selector import FeatureSelector, SUPPORTED_METHODS
+from typing import Dict, Any, List, Tuple
 
 class ClassificationEngine:
     """Classification Engine wrapper for Naive Bayes model"""
@@ -15,6 +17,10 @@ class ClassificationEngine:
         self._classifier = None
         self._target_column = None
         self._validator = Validator()
+        self._feature_rankings = None
+        self._trained_feature_count = None
+        self._selection_method = None
+        self._selection_report = None
     
     def build_model(self, data: pd.DataFrame, target_column: str) -> bool:
         """Build and train the classification model"""
@@ -28,8 +34,14 @@ class ClassificationEngine:
             y = data[target_column]
             if x.empty:
                 raise ValueError("No features available for training")
-            self._model = self._trainer.train(x, y)
+            model = self._trainer.train(x, y)
+            # Rank once from the count tables, then drop them so the served model holds only probabilities
+            self._feature_rankings = {method: FeatureSelector(method).rank_features(model) for method in SUPPORTED_METHODS}
+            self._trained_feature_count = len(model.features)
+            self._model = model.without_counts()
             self._classifier = NaiveBayesClassifier(self._model)
+            self._selection_method = None
+            self._selection_report = None
             return True
         except Exception as e:
             print(f"Error building model: {e}")
@@ -75,11 +87,102 @@ class ClassificationEngine:
         print(cm)
         print(f"Accuracy: {accuracy:.2%}")
     
+    def rank_features(self, method: str = 'mutual_info') -> List[Tuple[str, float]]:
+        """Return the ranking computed at training time for the features the active model still has"""
+        if not self._model:
+            raise ValueError("Model is not trained yet.")
+        FeatureSelector(method)  # Validates the method name
+        if not self._feature_rankings or method not in self._feature_rankings:
+            raise ValueError("Model has no feature ranking; retrain it to enable feature selection.")
+        features = set(self._model.features)
+        return [(feature, score) for feature, score in self._feature_rankings[method] if feature in features]
+    
+    def select_features(self, k: int, method: str = 'mutual_info') -> List[str]:
+        """Prune the active model to its top-k features.
+
+        The unpruned probabilities are released so memory actually drops; retrain to get them back.
+        """
+        ranking = self.rank_features(method)
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        if k < len(ranking):
+            self._model = self._model.subset([feature for feature, _ in ranking[:k]])
+            self._classifier = NaiveBayesClassifier(self._model)
+            self._selection_method = method
+        return list(self._model.features)
+    
+    def feature_selection_report(self, test_data: pd.DataFrame, target_column: str = None, ks: List[int] = None, method: str = 'mutual_info') -> List[Dict]:
+        """Measure accuracy, scoring latency and model size of the top-k pruned model for each k"""
+        ranking = self.rank_features(method)
+        test_target_column = target_column if target_column else self._target_column
+        if test_target_column not in test_data.columns:
+            raise ValueError(f"Test data must contain the target column '{test_target_column}'")
+        x_test = test_data.drop(columns=[test_target_column])
+        y_test = test_data[test_target_column]
+        feature_total = len(ranking)
+        if ks is None:
+            # Powers of two up to the current feature count
+            ks = sorted({min(2 ** i, feature_total) for i in range(feature_total.bit_length() + 1)})
+        report = []
+        for k in sorted(set(ks)):
+            if k < 1 or k > feature_total:
+                raise ValueError(f"k must be between 1 and {feature_total}")
+            model = self._model.subset([feature for feature, _ in ranking[:k]])
+            classifier = NaiveBayesClassifier(model)
+            start = time.perf_counter()
+            predictions = classifier.classify_group(x_test)
+            elapsed = time.perf_counter() - start
+            accuracy = sum(1 for prediction, actual in zip(predictions, y_test) if prediction == actual) / len(y_test)
+            report.append({
+                'k': k,
+                'Features': list(model.features),
+                'Accuracy': accuracy,
+                'Latency (ms/record)': elapsed * 1000 / len(y_test),
+                'Parameters': model.parameter_count()
+            })
+        self._selection_report = {'Method': method, 'Results': report}
+        return report
+    
     def get_classifier_info(self) -> Dict:
         """Return information about the underlying classifier"""
         if not self._model:
             return {'Status': 'Not trained'}
-        return self._model.get_model_info()
+        info = self._model.get_model_info()
+        method = self._selection_method or 'mutual_info'
+        if self._feature_rankings and method in self._feature_rankings:
+            info['Feature Ranking'] = {'Method': method, 'Scores': dict(self.rank_features(method))}
+        if self._selection_method:
+            info['Pruned From'] = self._trained_feature_count
+        if self._selection_report:
+            info['Feature Selection Report'] = self._selection_report
+        return info
+    
+    def get_state(self) -> Dict[str, Any]:
+        """Return the trained state so it can be published to other worker processes"""
+        return {
+            'model': self._model,
+            'target_column': self._target_column,
+            'feature_rankings': self._feature_rankings,
+            'trained_feature_count': self._trained_feature_count,
+            'selection_method': self._selection_method,
+            'selection_report': self._selection_report
+        }
+    
+    def set_state(self, state: Dict[str, Any]):
+        """Swap in a published state; in-flight calls keep the classifier they already hold"""
+        classifier = NaiveBayesClassifier(state['model']) if state['model'] is not None else None
+        self._model = state['model']
+        # Everything but the model is optional, so states published by older builds still load
+        self._target_column = state.get('target_column')
+        self._feature_rankings = state.get('feature_rankings')
+        self._trained_feature_count = state.get('trained_feature_count')
+        self._selection_method = state.get('selection_method')
+        self._selection_report = state.get('selection_report')
+        self._classifier = classifier
+    
+    def get_features(self) -> List[str]:
+        """Return the features the active model scores on"""
+        return list(self._model.features) if self._model else []
     
     def is_model_ready(self) -> bool:
         """Check if the model is trained and ready for predictions"""
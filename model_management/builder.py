@@ -13,6 +13,7 @@ class NaiveBayesTrainer:
         classes = y.unique()
         class_priors = {}
         feature_probabilities = {}
+        feature_counts = {}
         total_samples = len(y)
         laplace_alpha = self.cleaner.get_laplace_alpha()
         # Calculate prior probabilities for each class
@@ -22,15 +23,18 @@ class NaiveBayesTrainer:
         # Calculate conditional probabilities for each feature given each class
         for feature in features:
             feature_probabilities[feature] = {}
+            feature_counts[feature] = {}
             unique_values = x[feature].unique()
             for class_value in classes:
                 # Initialize the feature probabilities for the class
                 feature_probabilities[feature][class_value] = {}
+                feature_counts[feature][class_value] = {}
                 class_mask = y == class_value
                 class_feature_data = x.loc[class_mask, feature]
                 class_size = len(class_feature_data)
                 for value in unique_values:
                     value_count = (class_feature_data == value).sum()
+                    feature_counts[feature][class_value][value] = int(value_count)
                     feature_probabilities[feature][class_value][value] = (value_count + laplace_alpha) / (class_size + laplace_alpha * len(unique_values))
         # Return the model
-        return NaiveBayesModel(class_priors, feature_probabilities, classes, features) 
\ No newline at end of file
+        return NaiveBayesModel(class_priors, feature_probabilities, classes, features, feature_counts) 
\ No newline at end of file
@@ -1,5 +1,7 @@
 import pandas as pd
-from typing import List, Tuple
+import pyarrow as pa
+import pyarrow.parquet as pq
+from typing import List, Tuple, Optional
 
 class DataLoader:
     """Class for loading and converting csv files"""
@@ -37,6 +39,49 @@ class DataLoader:
             print(f"Error loading file: {e}")
             return False
         
+    def load_parquet(self, file_path: str, columns: Optional[List[str]] = None) -> bool:
+        """Load parquet file, reading only the requested columns if given"""
+        try:
+            if not file_path or not file_path.strip():
+                raise ValueError("File path cannot be empty")
+            
+            # Parquet is columnar, so unrequested columns are never decoded
+            table = pq.read_table(file_path, columns=columns, memory_map=True)
+            return self._set_table(table)
+        except FileNotFoundError:
+            print(f"File not found: {file_path}")
+            return False
+        except Exception as e:
+            print(f"Error loading file: {e}")
+            return False
+    
+    def load_arrow(self, file_path: str, columns: Optional[List[str]] = None) -> bool:
+        """Load Arrow IPC (file or stream format), reading only the requested columns if given"""
+        try:
+            if not file_path or not file_path.strip():
+                raise ValueError("File path cannot be empty")
+            
+            # Memory map the file so record batches reference it without copying
+            with pa.memory_map(file_path, 'r') as source:
+                table = read_arrow_ipc(source)
+            if columns is not None:
+                table = table.select(columns)
+            return self._set_table(table)
+        except FileNotFoundError:
+            print(f"File not found: {file_path}")
+            return False
+        except Exception as e:
+            print(f"Error loading file: {e}")
+            return False
+    
+    def _set_table(self, table: pa.Table) -> bool:
+        """Convert an Arrow table to a DataFrame and store it with headers"""
+        if table.num_rows == 0:
+            raise ValueError("File is empty")
+        self._data = table.to_pandas()
+        self._headers = list(self._data.columns)
+        return True
+        
     def get_data(self) -> pd.DataFrame:
         """Return copy of loaded data"""
         return self._data.copy() if self._data is not None else None
@@ -54,4 +99,13 @@ class DataLoader:
         features = self._data.drop(columns=[target_column])
         target = self._data[target_column]
         return features, target
-    
\ No newline at end of file
+
+
+def read_arrow_ipc(source) -> pa.Table:
+    """Read an Arrow IPC source in either the file or the stream format"""
+    try:
+        return pa.ipc.open_file(source).read_all()
+    except pa.ArrowInvalid:
+        # Not the random access file format, so rewind and read it as a stream
+        source.seek(0)
+        return pa.ipc.open_stream(source).read_all()
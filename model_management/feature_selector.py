@@ -0,0 +1,64 @@
+import numpy as np
+from scipy.stats import chi2, norm
+from typing import List, Tuple
+from .model import NaiveBayesModel
+
+SUPPORTED_METHODS = ['mutual_info', 'chi2']
+MAX_DISTINCT_RATIO = 0.5  # Features with more distinct values per row than this are treated as IDs
+
+class FeatureSelector:
+    """Ranks model features using the count tables built during training"""
+    def __init__(self, method: str = 'mutual_info'):
+        if method not in SUPPORTED_METHODS:
+            raise ValueError(f"Unknown feature selection method '{method}', expected one of: {', '.join(SUPPORTED_METHODS)}")
+        self.method = method
+
+    def score_feature(self, model: NaiveBayesModel, feature: str) -> float:
+        """Score a single feature against the class from its value x class contingency table.
+
+        Both scores correct for the number of distinct values, so ID-like columns do not rank first:
+        'mutual_info' is symmetric uncertainty, 2 * I(X;Y) / (H(X) + H(Y)), in [0, 1];
+        'chi2' is -log10 of the chi-square test p-value with (|values| - 1) * (|classes| - 1) degrees of freedom.
+        ID-like features, with more than MAX_DISTINCT_RATIO distinct values per row, score 0 as they cannot generalize.
+        """
+        feature_counts = model.feature_counts[feature]
+        classes = list(model.classes)
+        values = list(feature_counts[classes[0]].keys())
+        # Rows are feature values, columns are classes
+        observed = np.array([[feature_counts[class_value][value] for class_value in classes] for value in values], dtype=float)
+        total = observed.sum()
+        if total == 0 or observed.shape[0] < 2 or observed.shape[1] < 2:
+            return 0.0
+        if observed.shape[0] > MAX_DISTINCT_RATIO * total:
+            return 0.0
+        value_totals = observed.sum(axis=1)
+        class_totals = observed.sum(axis=0)
+        expected = np.outer(value_totals, class_totals) / total
+        if self.method == 'mutual_info':
+            nonzero = observed > 0
+            mutual_info = np.sum(observed[nonzero] / total * np.log(observed[nonzero] / expected[nonzero]))
+            entropy_x = self._entropy(value_totals / total)
+            entropy_y = self._entropy(class_totals / total)
+            return float(2 * mutual_info / (entropy_x + entropy_y)) if entropy_x + entropy_y > 0 else 0.0
+        # Pearson chi-square statistic, skipping cells with no expected mass
+        positive = expected > 0
+        statistic = np.sum((observed[positive] - expected[positive]) ** 2 / expected[positive])
+        dof = (observed.shape[0] - 1) * (observed.shape[1] - 1)
+        log_p = chi2.logsf(statistic, dof)
+        if not np.isfinite(log_p):
+            # Far in the tail logsf underflows; the Wilson-Hilferty normal approximation keeps strong features apart
+            z = ((statistic / dof) ** (1 / 3) - (1 - 2 / (9 * dof))) / np.sqrt(2 / (9 * dof))
+            log_p = norm.logsf(z)
+        return float(-log_p / np.log(10))
+
+    @staticmethod
+    def _entropy(probabilities: np.ndarray) -> float:
+        probabilities = probabilities[probabilities > 0]
+        return float(-np.sum(probabilities * np.log(probabilities)))
+
+    def rank_features(self, model: NaiveBayesModel) -> List[Tuple[str, float]]:
+        """Return (feature, score) pairs sorted from most to least informative"""
+        if not model.has_counts():
+            raise ValueError("Model has no count tables; retrain it to enable feature selection.")
+        scores = [(feature, self.score_feature(model, feature)) for feature in model.features]
+        return sorted(scores, key=lambda item: item[1], reverse=True)
@@ -2,11 +2,13 @@ from typing import Dict
 
 class NaiveBayesModel:
     """Holds trained parameters for Naive Bayes"""
-    def __init__(self, class_priors, feature_probabilities, classes, features):
+    def __init__(self, class_priors, feature_probabilities, classes, features, feature_counts=None):
         self._class_priors = class_priors
         self._feature_probabilities = feature_probabilities
         self._classes = classes
         self._features = features
+        # Raw value x class count tables kept from training, used for feature ranking
+        self._feature_counts = feature_counts
         self._is_trained = True
 
     def is_trained(self) -> bool:
@@ -18,9 +20,14 @@ class NaiveBayesModel:
             'Classes': list(self._classes),
             'Features': self._features,
             'Number of Classes': len(self._classes),
-            'Number of Features': len(self._features)
+            'Number of Features': len(self._features),
+            'Number of Parameters': self.parameter_count()
         }
 
+    def parameter_count(self) -> int:
+        """Number of stored conditional probabilities, a proxy for model size"""
+        return sum(len(values) for feature in self._features for values in self._feature_probabilities[feature].values())
+
     @property
     def class_priors(self):
         return self._class_priors
@@ -35,4 +42,29 @@ class NaiveBayesModel:
 
     @property
     def features(self):
-        return self._features 
\ No newline at end of file
+        return self._features
+
+    @property
+    def feature_counts(self):
+        return self._feature_counts
+
+    def has_counts(self) -> bool:
+        return self._feature_counts is not None
+
+    def without_counts(self) -> 'NaiveBayesModel':
+        """Return the same model without its count tables, which are only needed for feature ranking"""
+        return NaiveBayesModel(self._class_priors, self._feature_probabilities, self._classes, self._features)
+
+    def subset(self, features) -> 'NaiveBayesModel':
+        """Return a new model that keeps only the given features"""
+        missing = [feature for feature in features if feature not in self._feature_probabilities]
+        if missing:
+            raise ValueError(f"Features not in model: {missing}")
+        feature_counts = {feature: self._feature_counts[feature] for feature in features} if self._feature_counts is not None else None
+        return NaiveBayesModel(
+            self._class_priors,
+            {feature: self._feature_probabilities[feature] for feature in features},
+            self._classes,
+            list(features),
+            feature_counts
+        ) 
\ No newline at end of file
@@ -0,0 +1,85 @@
+import fcntl
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+from contextlib import contextmanager
+from typing import Any, Tuple
+
+VERSION_FORMAT = '<Q'  # Unsigned 64-bit version counter
+VERSION_SIZE = struct.calcsize(VERSION_FORMAT)
+DEFAULT_STORE_DIR = os.getenv('MODEL_STORE_DIR', 'model_store')
+KEEP_VERSIONS = 3  # Older artifacts are kept briefly for workers still loading them
+
+class ModelStore:
+    """Local artifact store that lets several worker processes share published model versions"""
+    def __init__(self, store_dir: str = DEFAULT_STORE_DIR, keep_versions: int = KEEP_VERSIONS):
+        os.makedirs(store_dir, exist_ok=True)
+        self.store_dir = store_dir
+        self.keep_versions = keep_versions
+        self._lock_path = os.path.join(store_dir, 'store.lock')
+        # The version counter lives in a shared memory map, so checking it costs no system call
+        fd = os.open(os.path.join(store_dir, 'version'), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if os.fstat(fd).st_size < VERSION_SIZE:
+                # Growing the file zero-fills it, so a concurrent publish is never overwritten
+                os.ftruncate(fd, VERSION_SIZE)
+            self._version_map = mmap.mmap(fd, VERSION_SIZE)
+        finally:
+            os.close(fd)
+
+    @contextmanager
+    def _locked(self):
+        """Hold an exclusive cross-process lock on the store"""
+        with open(self._lock_path, 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _artifact_path(self, version: int) -> str:
+        return os.path.join(self.store_dir, f'model-{version}.pkl')
+
+    def current_version(self) -> int:
+        """Return the latest published version, or 0 if nothing has been published"""
+        return struct.unpack_from(VERSION_FORMAT, self._version_map)[0]
+
+    def publish(self, state: Any) -> int:
+        """Write a new model artifact and make it the current version"""
+        with self._locked():
+            version = self.current_version() + 1
+            fd, tmp_path = tempfile.mkstemp(dir=self.store_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._artifact_path(version))
+            # Bump the counter only once the artifact is in place, so readers never see a missing version
+            struct.pack_into(VERSION_FORMAT, self._version_map, 0, version)
+            self._version_map.flush()
+            self._prune(version)
+        return version
+
+    def load(self) -> Tuple[int, Any]:
+        """Return (version, state) of the latest published model, or (0, None) if there is none"""
+        while True:
+            version = self.current_version()
+            if version == 0:
+                return 0, None
+            try:
+                with open(self._artifact_path(version), 'rb') as f:
+                    return version, pickle.load(f)
+            except FileNotFoundError:
+                # Pruned by a newer publish while we were reading; retry with the newer version
+                if self.current_version() == version:
+                    raise
+
+    def _prune(self, latest: int):
+        """Remove the artifact that just fell out of the last keep_versions versions"""
+        version = latest - self.keep_versions
+        if version < 1:
+            return
+        try:
+            os.remove(self._artifact_path(version))
+        except FileNotFoundError:
+            pass
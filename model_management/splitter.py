@@ -0,0 +1,224 @@
+import os
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from fractions import Fraction
+from math import lcm
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+DEFAULT_CHUNK_ROWS = 100_000  # Rows read, assigned and written per step
+MAX_BLOCK_SIZE = 1000  # Upper bound on rows per class over which split proportions are exact
+WRITE_BUFFER_SIZE = 8 * 1024 * 1024  # 8MB output buffer for CSV files
+SUPPORTED_OUTPUT_FORMATS = ['csv', 'parquet']
+PROMOTION_TYPES = [pa.int64(), pa.float64()]  # Narrowest first; text columns that fit neither stay strings
+
+def smallest_block_size(ratios: Sequence[float], max_block_size: int = MAX_BLOCK_SIZE) -> int:
+    """Return the fewest slots that represent the ratios exactly, e.g. 10 for 0.7/0.3"""
+    fractions = [Fraction(ratio).limit_denominator(max_block_size) for ratio in ratios]
+    return min(lcm(*(fraction.denominator for fraction in fractions)), max_block_size)
+
+class StratifiedAssigner:
+    """Assigns rows to splits per class from seeded, shuffled blocks of split slots"""
+    def __init__(self, ratios: Sequence[float], seed: int = 42, block_size: int = None):
+        ratios = np.asarray(ratios, dtype=float)
+        if len(ratios) < 2 or np.any(ratios <= 0):
+            raise ValueError("At least two positive split ratios are required")
+        ratios = ratios / ratios.sum()
+        # Small blocks keep small classes stratified too: every full block has the exact proportions
+        if block_size is None:
+            block_size = smallest_block_size(ratios)
+        # Largest remainder rounding so each block holds exactly block_size slots
+        counts = np.floor(ratios * block_size).astype(int)
+        remainders = ratios * block_size - counts
+        counts[np.argsort(-remainders)[:block_size - counts.sum()]] += 1
+        self._block = np.repeat(np.arange(len(ratios)), counts)
+        self._seed = seed
+        self._rngs: Dict[object, np.random.Generator] = {}
+        self._pending: Dict[object, np.ndarray] = {}
+
+    def _take(self, label, n: int) -> np.ndarray:
+        """Take the next n split slots for a class, drawing fresh shuffled blocks as needed"""
+        if label not in self._rngs:
+            # One generator per class, keyed by order of first appearance, so chunk size never changes the split
+            self._rngs[label] = np.random.default_rng([self._seed, len(self._rngs)])
+            self._pending[label] = self._block[:0]
+        slots = self._pending[label]
+        if len(slots) < n:
+            blocks_needed = -(-(n - len(slots)) // len(self._block))
+            rng = self._rngs[label]
+            slots = np.concatenate([slots] + [rng.permutation(self._block) for _ in range(blocks_needed)])
+        self._pending[label] = slots[n:]
+        return slots[:n]
+
+    def assign(self, labels) -> np.ndarray:
+        """Return the split index for each label, in order"""
+        codes, uniques = pd.factorize(labels, use_na_sentinel=False)
+        splits = np.empty(len(codes), dtype=np.int64)
+        for code, label in enumerate(uniques):
+            positions = np.flatnonzero(codes == code)
+            # NaN never equals itself, so missing labels share a single key
+            splits[positions] = self._take(None if pd.isna(label) else label, len(positions))
+        return splits
+
+
+class ColumnTypeInferrer:
+    """Tracks, per text column, the narrowest type that holds every value seen so far"""
+    def __init__(self, names: Sequence[str]):
+        # -1 means only nulls seen; otherwise an index into PROMOTION_TYPES, or past its end for strings
+        self._levels = {name: -1 for name in names}
+
+    def update(self, table: pa.Table):
+        for name in table.column_names:
+            column = table.column(name)
+            if column.null_count == len(column) or self._levels[name] >= len(PROMOTION_TYPES):
+                continue
+            level = max(self._levels[name], 0)
+            while level < len(PROMOTION_TYPES):
+                try:
+                    pc.cast(column, PROMOTION_TYPES[level])
+                    break
+                except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                    level += 1
+            self._levels[name] = level
+
+    def schema(self) -> pa.Schema:
+        return pa.schema([
+            (name, PROMOTION_TYPES[level] if 0 <= level < len(PROMOTION_TYPES) else pa.string())
+            for name, level in self._levels.items()
+        ])
+
+
+class CsvSink:
+    """Appends table chunks to a CSV file through a large write buffer"""
+    def __init__(self, path: str, schema: pa.Schema):
+        self.path = path
+        self._columns = schema.names
+        self._file = open(path, 'w', newline='', buffering=WRITE_BUFFER_SIZE)
+        self._header = True
+
+    def write(self, table: pa.Table):
+        table.to_pandas().to_csv(self._file, header=self._header, index=False)
+        self._header = False
+
+    def close(self, column_types: pa.Schema = None):
+        if self._header:
+            # No rows were assigned here; still write the header so the file is valid
+            pd.DataFrame(columns=self._columns).to_csv(self._file, index=False)
+        self._file.close()
+
+    def discard(self):
+        self._file.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class ParquetSink:
+    """Appends table chunks to a Parquet file as row groups.
+
+    With promote_types, chunks are written as text to a temporary file and rewritten
+    once at close with the column types inferred over the whole input.
+    """
+    def __init__(self, path: str, schema: pa.Schema, promote_types: bool = False):
+        self.path = path
+        self._promote_types = promote_types
+        self._write_path = f"{path}.text.tmp" if promote_types else path
+        self._writer = pq.ParquetWriter(self._write_path, schema)
+
+    def write(self, table: pa.Table):
+        self._writer.write_table(table)
+
+    def close(self, column_types: pa.Schema = None):
+        self._writer.close()
+        if not self._promote_types:
+            return
+        text_file = pq.ParquetFile(self._write_path)
+        with pq.ParquetWriter(self.path, column_types) as writer:
+            for batch in text_file.iter_batches(batch_size=DEFAULT_CHUNK_ROWS):
+                writer.write_table(pa.Table.from_batches([batch]).cast(column_types))
+        os.remove(self._write_path)
+
+    def discard(self):
+        self._writer.close()
+        for path in (self._write_path, self.path):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def read_schema(input_path: str) -> pa.Schema:
+    """Return the input schema: the Parquet schema, or every CSV header column as text"""
+    if input_path.lower().endswith('.parquet'):
+        return pq.read_schema(input_path)
+    header = pd.read_csv(input_path, nrows=0).columns
+    return pa.schema([(name, pa.string()) for name in header])
+
+def read_chunks(input_path: str, schema: pa.Schema, chunk_rows: int = DEFAULT_CHUNK_ROWS, keep_empty_strings: bool = False) -> Iterator[pa.Table]:
+    """Yield a CSV or Parquet file as Arrow tables of at most chunk_rows rows with a fixed schema"""
+    if input_path.lower().endswith('.parquet'):
+        for batch in pq.ParquetFile(input_path).iter_batches(batch_size=chunk_rows):
+            yield pa.Table.from_batches([batch])
+    else:
+        # CSV is read as text so every chunk has the same schema; keeping empty strings reproduces values exactly in CSV output
+        for chunk in pd.read_csv(input_path, chunksize=chunk_rows, dtype=str, keep_default_na=not keep_empty_strings):
+            yield pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+
+def default_output_paths(input_path: str, split_count: int, output_format: str) -> List[str]:
+    """Name outputs <base>_train/<base>_test for two splits, <base>_part<i> otherwise"""
+    base = os.path.splitext(input_path)[0]
+    if split_count == 2:
+        return [f"{base}_train.{output_format}", f"{base}_test.{output_format}"]
+    return [f"{base}_part{i + 1}.{output_format}" for i in range(split_count)]
+
+def split_file(input_path: str, ratios: Sequence[float] = (0.7, 0.3), target_column: str = None, seed: int = 42, output_paths: Sequence[str] = None, output_format: str = None, chunk_rows: int = DEFAULT_CHUNK_ROWS, block_size: int = None) -> List[Tuple[str, int]]:
+    """Split a CSV or Parquet file into len(ratios) files in one streaming pass, stratified by target_column if given.
+
+    Memory stays bounded by chunk_rows regardless of input size. The same seed and input always produce the same split.
+    If anything fails, partially written outputs are removed.
+    """
+    if not os.path.exists(input_path):
+        raise FileNotFoundError(f"File not found: {input_path}")
+    if output_format is None:
+        output_format = 'parquet' if input_path.lower().endswith('.parquet') else 'csv'
+    if output_format not in SUPPORTED_OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output format '{output_format}', expected one of: {', '.join(SUPPORTED_OUTPUT_FORMATS)}")
+    assigner = StratifiedAssigner(ratios, seed=seed, block_size=block_size)
+    if output_paths is None:
+        output_paths = default_output_paths(input_path, len(ratios), output_format)
+    if len(output_paths) != len(ratios):
+        raise ValueError("One output path is required per split ratio")
+    schema = read_schema(input_path)
+    if target_column is not None and target_column not in schema.names:
+        raise ValueError(f"Target column '{target_column}' not found in the data")
+
+    # CSV to Parquet: infer column types over the whole input rather than per chunk
+    is_csv_input = not input_path.lower().endswith('.parquet')
+    type_inferrer = ColumnTypeInferrer(schema.names) if is_csv_input and output_format == 'parquet' else None
+    sinks = []
+    row_counts = [0] * len(output_paths)
+    try:
+        for path in output_paths:
+            if output_format == 'csv':
+                sinks.append(CsvSink(path, schema))
+            else:
+                sinks.append(ParquetSink(path, schema, promote_types=type_inferrer is not None))
+        for chunk in read_chunks(input_path, schema, chunk_rows, keep_empty_strings=output_format == 'csv'):
+            if type_inferrer is not None:
+                type_inferrer.update(chunk)
+            # Without a target every row belongs to one stratum, which gives a plain random split
+            labels = chunk.column(target_column).to_pandas() if target_column is not None else np.zeros(chunk.num_rows)
+            splits = assigner.assign(labels)
+            for index, sink in enumerate(sinks):
+                part = chunk.filter(pa.array(splits == index))
+                if part.num_rows:
+                    sink.write(part)
+                    row_counts[index] += part.num_rows
+        column_types = type_inferrer.schema() if type_inferrer is not None else None
+        for sink in sinks:
+            sink.close(column_types)
+    except BaseException:
+        # Remove every output this run opened, finalized or not, so a failed split leaves nothing behind
+        for sink in sinks:
+            sink.discard()
+        raise
+    return list(zip(output_paths, row_counts))
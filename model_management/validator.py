@@ -1,7 +1,8 @@
 import pandas as pd
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import confusion_matrix
-from typing import Tuple, Any
+from typing import Tuple, Any, List, Sequence
+from .splitter import split_file
 
 class Validator:
     """Provides validation utilities such as train-test split and confusion matrix."""
@@ -12,6 +13,12 @@ class Validator:
         x_train, x_test, y_train, y_test = train_test_split(x, y, test_size=test_size, random_state=random_state, stratify=y)
         return x_train, x_test, y_train, y_test
 
+    def split_file(self, input_path: str, target_column: str, test_size: float = 0.3, random_state: int = 42, ratios: Sequence[float] = None, output_paths: Sequence[str] = None, output_format: str = None) -> List[Tuple[str, int]]:
+        """Stratified split of a CSV or Parquet file straight to disk without loading it (default 70/30, or k-way with ratios)."""
+        if ratios is None:
+            ratios = (1 - test_size, test_size)
+        return split_file(input_path, ratios, target_column=target_column, seed=random_state, output_paths=output_paths, output_format=output_format)
+
     def compute_confusion_matrix(self, y_true: Any, y_pred: Any) -> Any:
         """Compute confusion matrix given true and predicted labels."""
         return confusion_matrix(y_true, y_pred)
@@ -1,30 +1,26 @@
-import pandas as pd
-from sklearn.model_selection import train_test_split
-import sys, os
+import argparse
+from model_management.splitter import split_file
 
-def split_csv(file, train_ratio=0.7):
-    """Splitting dataset"""
-    df = pd.read_csv(file)
+def split_csv(file, train_ratio=0.7, target_column=None, seed=42, ratios=None, output_format=None):
+    """Splitting dataset in a single streaming pass"""
+    if ratios is None:
+        ratios = (train_ratio, 1 - train_ratio)
     
-    # Splitting using sklearn
-    train_df, test_df = train_test_split(df, train_size=train_ratio, random_state=42, shuffle=True)
+    # Output file names default to <base>_train/<base>_test, or <base>_part<i> for k-way splits
+    outputs = split_file(file, ratios, target_column=target_column, seed=seed, output_format=output_format)
     
-    # Output file name
-    base, ext = os.path.splitext(file)
-    train_file = f"{base}_train{ext}"
-    test_file = f"{base}_test{ext}"
-    
-    # Save
-    train_df.to_csv(train_file, index=False)
-    test_df.to_csv(test_file, index=False)
-    
-    print(f"Split complete: {train_file} ({len(train_df)} rows), {test_file} ({len(test_df)} rows)")
+    summary = ", ".join(f"{path} ({rows} rows)" for path, rows in outputs)
+    print(f"Split complete: {summary}")
     
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python split_csv.py <input_csv> [train_ratio]")
-        sys.exit(1)
-    input_csv = sys.argv[1]
-    ratio = float(sys.argv[2]) if len(sys.argv) > 2 else 0.7
-    split_csv(input_csv, train_ratio=ratio)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Split a CSV or Parquet file into train/test (or k) files")
+    parser.add_argument("input", help="Input .csv or .parquet file")
+    parser.add_argument("train_ratio", nargs="?", type=float, default=0.7, help="Train fraction for a two-way split")
+    parser.add_argument("--target", help="Target column to stratify by")
+    parser.add_argument("--ratios", help="Comma-separated ratios for a k-way split, e.g. 0.6,0.2,0.2")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--format", choices=["csv", "parquet"], help="Output format (default: same as input)")
+    args = parser.parse_args()
+    ratios = [float(value) for value in args.ratios.split(",")] if args.ratios else None
+    split_csv(args.input, train_ratio=args.train_ratio, target_column=args.target, seed=args.seed, ratios=ratios, output_format=args.format)